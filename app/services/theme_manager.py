@@ -18,6 +18,7 @@ class ThemeManager(QObject):
 
     current_theme: Optional[str]
     current_palette: Optional[dict[str, Any]]
+    _stylesheet_cache: dict[tuple[Optional[str], str], str]
 
     def __init__(self, themes_path: Optional[str] = None) -> None:
         """Initialize the ThemeManager.
@@ -31,6 +32,7 @@ class ThemeManager(QObject):
         self.themes_path = themes_path if themes_path is not None else str(THEMES_DIR)
         self.palette_paths = self._discover_palettes()
         self.current_palette = None
+        self._stylesheet_cache = {}
 
     def _discover_palettes(self) -> dict[str, str]:
         """Discover available JSON palette files in the themes directory.
@@ -112,7 +114,8 @@ class ThemeManager(QObject):
     def load_stylesheet_with_theme(self, qss_path: str) -> str:
         """Load a QSS file and apply the current palette.
 
-        Supports both absolute and relative paths.
+        Supports both absolute and relative paths. Results are cached per theme
+        and path, so switching back to a theme does not read the file again.
 
         Args:
             qss_path (str): Path to the QSS file.
@@ -121,6 +124,10 @@ class ThemeManager(QObject):
             str: The QSS with color placeholders replaced, or an empty string if not
             found.
         """
+        cache_key = (self.current_theme, qss_path)
+        cached = self._stylesheet_cache.get(cache_key)
+        if cached is not None:
+            return cached
         if not os.path.isabs(qss_path):
             rel_path = os.path.join(self.themes_path, qss_path)
             if os.path.exists(rel_path):
@@ -135,4 +142,5 @@ class ThemeManager(QObject):
             flat_palette = self._flatten_dict(palette)
             for key, value in flat_palette.items():
                 qss = qss.replace(f"{{{key}}}", value)
+        self._stylesheet_cache[cache_key] = qss
         return qss
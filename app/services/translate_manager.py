@@ -7,6 +7,8 @@ class TranslateManager:
     """Manager for loading and providing translations from JSON files."""
 
     translations: Dict[str, str]
+    _catalogs: Dict[str, Dict[str, str]]
+    _languages: list[str]
 
     def __init__(self, locales_path: str, default_language: str = "en") -> None:
         """Initialize the TranslateManager.
@@ -18,39 +20,60 @@ class TranslateManager:
         self.locales_path = locales_path
         self.current_language = default_language
         self.translations = {}
+        self._catalogs = {}
+        self._languages = self._discover_languages()
         self.load_language(default_language)
 
+    def _discover_languages(self) -> list[str]:
+        """Discover language directories that contain a JSON catalog.
+
+        Returns:
+            list[str]: Sorted list of language codes found in the locales directory.
+        """
+        langs: list[str] = []
+        if not os.path.isdir(self.locales_path):
+            return langs
+        with os.scandir(self.locales_path) as entries:
+            for entry in entries:
+                if entry.is_dir() and any(
+                    f.endswith(".json") for f in os.listdir(entry.path)
+                ):
+                    langs.append(entry.name)
+        return sorted(langs)
+
     def available_languages(self) -> list[str]:
         """Get a list of available language codes.
 
+        The locales directory is scanned once, when the manager is created.
+
         Returns:
             list: A list of available language codes.
         """
-        langs: list[str] = []
-        for lang_dir in os.listdir(self.locales_path):
-            lang_path = os.path.join(self.locales_path, lang_dir)
-            if os.path.isdir(lang_path):
-                json_files = [f for f in os.listdir(lang_path) if f.endswith(".json")]
-                if json_files:
-                    langs.append(lang_dir)
-        return langs
+        return list(self._languages)
 
     def load_language(self, language_code: str) -> bool:
         """Load translations for the given language code.
 
+        Parsed catalogs are kept in memory, so switching back to a language that
+        was already loaded does not touch the disk again.
+
         Args:
             language_code (str): The language code to load.
 
         Returns:
             bool: True if loaded successfully, False otherwise.
         """
-        lang_dir = os.path.join(self.locales_path, language_code)
-        json_files = [f for f in os.listdir(lang_dir) if f.endswith(".json")]
-        if not json_files:
-            return False
-        json_file = os.path.join(lang_dir, json_files[0])
-        with open(json_file, "r", encoding="utf-8") as f:
-            self.translations = json.load(f)
+        catalog = self._catalogs.get(language_code)
+        if catalog is None:
+            lang_dir = os.path.join(self.locales_path, language_code)
+            json_files = [f for f in os.listdir(lang_dir) if f.endswith(".json")]
+            if not json_files:
+                return False
+            json_file = os.path.join(lang_dir, json_files[0])
+            with open(json_file, "r", encoding="utf-8") as f:
+                catalog = json.load(f)
+            self._catalogs[language_code] = catalog
+        self.translations = catalog
         self.current_language = language_code
         return True
 
@@ -1,11 +1,13 @@
 from typing import Any, Callable
 
-from PyQt6.QtCore import QObject
+from PyQt6.QtCore import QObject, pyqtSignal
 
 
 class Worker(QObject):
     """General-purpose worker for running any function in a background thread."""
 
+    finished = pyqtSignal()
+
     fn: Callable[..., Any]
     args: tuple[Any, ...]
     kwargs: dict[str, Any]
@@ -26,3 +28,4 @@ class Worker(QObject):
     def run(self) -> None:
         """Run the worker function in a background thread."""
         self.fn(*self.args, **self.kwargs)
+        self.finished.emit()
@@ -1,7 +1,8 @@
-from typing import Any
+from typing import Any, Optional
 
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import QCoreApplication, QThread, pyqtSignal, pyqtSlot
 
+from app.utils.worker import Worker
 from app.view_models.base_view_model import BaseViewModel
 
 
@@ -10,7 +11,9 @@ class CounterViewModel(BaseViewModel):
 
     count_changed = pyqtSignal(int)  # Signal to update the count in the views
     can_increment_changed = pyqtSignal(bool)
-    model: Any
+    _model: Any
+    _thread: Optional[QThread]
+    _worker: Optional[Worker]
 
     def __init__(self, model: Any) -> None:
         """Initialize the CounterViewModel.
@@ -20,8 +23,44 @@ class CounterViewModel(BaseViewModel):
         """
         super().__init__()
         self._model = model
-        # Add any additional initialization or properties as needed
+        self._thread = None
+        self._worker = None
+
+        # Stop a running increment before Qt tears the thread down on exit
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
 
     def increment(self) -> None:
-        """Increment the counter in the model."""
-        self.model.increment()
+        """Increment the counter in the model on a background thread."""
+        if self._thread is not None:
+            return
+        self.can_increment_changed.emit(False)
+
+        self._thread = QThread(self)
+        self._worker = Worker(self._model.increment)
+        self._worker.moveToThread(self._thread)
+
+        # Bound-method slots only: no per-click closures
+        self._thread.started.connect(self._worker.run)
+        self._worker.finished.connect(self._thread.quit)
+        self._worker.finished.connect(self._worker.deleteLater)
+        self._thread.finished.connect(self._thread.deleteLater)
+        self._thread.finished.connect(self._on_finished)
+        self._thread.start()
+
+    @pyqtSlot()
+    def _on_finished(self) -> None:
+        """Publish the new count once the background increment is done."""
+        self._thread = None
+        self._worker = None
+        self.count_changed.emit(self._model.count)
+        self.can_increment_changed.emit(True)
+
+    @pyqtSlot()
+    def shutdown(self) -> None:
+        """Quit and wait for a running background increment, if any."""
+        if self._thread is None:
+            return
+        self._thread.quit()
+        self._thread.wait()
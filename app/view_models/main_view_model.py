@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import Any, Callable
 
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import QApplication, QWidget
@@ -20,12 +21,9 @@ class MainViewModel(BaseViewModel):
     language_changed = pyqtSignal(str)
 
     _model: Any
-    home_vm: CounterViewModel
-    home_view: CounterView
-    test_vm: TestViewModel
-    test_view: TestView
     theme_manager: ThemeManager
     translate_manager: TranslateManager
+    _views: dict[str, Callable[[], QWidget]]
 
     def __init__(self, model: Any, context: AppContext | None = None) -> None:
         """Initialize the main view model.
@@ -38,12 +36,48 @@ class MainViewModel(BaseViewModel):
         self._model = model
         self.theme_manager = self.context.theme_manager
         self.translate_manager = self.context.translate_manager
+        # Navigation name -> getter for the (lazily built) view
+        self._views = {
+            "home": lambda: self.home_view,
+            "settings": lambda: self.test_view,
+        }
 
-        self.home_vm = CounterViewModel(self._model)
-        self.home_view = CounterView(self.home_vm)
+    # Sub-views are built on first navigation, not at startup
+    @cached_property
+    def home_vm(self) -> CounterViewModel:
+        """Return the view model for the home view.
 
-        self.test_vm = TestViewModel(self._model)
-        self.test_view = TestView(self._model)
+        Returns:
+            CounterViewModel: The view model for the home view.
+        """
+        return CounterViewModel(self._model)
+
+    @cached_property
+    def home_view(self) -> CounterView:
+        """Return the home view, creating it on first access.
+
+        Returns:
+            CounterView: The home view.
+        """
+        return CounterView(self.home_vm)
+
+    @cached_property
+    def test_vm(self) -> TestViewModel:
+        """Return the view model for the settings view.
+
+        Returns:
+            TestViewModel: The view model for the settings view.
+        """
+        return TestViewModel(self._model)
+
+    @cached_property
+    def test_view(self) -> TestView:
+        """Return the settings view, creating it on first access.
+
+        Returns:
+            TestView: The settings view.
+        """
+        return TestView(self.test_vm)
 
     @property
     def available_languages(self) -> list[str]:
@@ -63,6 +97,15 @@ class MainViewModel(BaseViewModel):
         """
         return self.theme_manager.available_themes()
 
+    @property
+    def current_language(self) -> str:
+        """Return the code of the current language.
+
+        Returns:
+            str: The code of the current language.
+        """
+        return self.translate_manager.current_language
+
     @property
     def current_theme(self) -> str:
         """Return the name of the current theme.
@@ -96,10 +139,9 @@ class MainViewModel(BaseViewModel):
         Args:
             name (str): The name of the view to display.
         """
-        if name == "home":
-            self.current_view_changed.emit(self.home_view)
-        elif name == "settings":
-            self.current_view_changed.emit(self.test_view)
+        get_view = self._views.get(name)
+        if get_view is not None:
+            self.current_view_changed.emit(get_view())
 
     def set_language(self, language_code: str) -> None:
         """Set the application language.
@@ -20,6 +20,7 @@ class BaseView(QWidget):
     """
 
     _context_provider: Optional[Callable[[], AppContext]] = None
+    _qss_path: Optional[str]
 
     @classmethod
     def set_context_provider(cls, provider: Callable[[], AppContext]) -> None:
@@ -58,6 +59,8 @@ class BaseView(QWidget):
             )
         self.theme_manager = self.context.theme_manager
         self.qss_filename = qss_filename
+        # Resolved once; theme changes only re-apply the palette
+        self._qss_path = self._resolve_qss_path()
         # Translation function from context
         self.t = self.context.translate
         # Theme support
@@ -65,21 +68,23 @@ class BaseView(QWidget):
             self.theme_manager.theme_changed.connect(self.reload_stylesheet)
             self.reload_stylesheet()
 
+    def _resolve_qss_path(self) -> Optional[str]:
+        """Resolve qss_filename to an existing file path.
+
+        Returns:
+            Optional[str]: The absolute QSS path, or None if it is unset or missing.
+        """
+        if not self.qss_filename:
+            return None
+        # Use absolute path if provided, otherwise resolve relative to this file
+        if os.path.isabs(self.qss_filename) and os.path.exists(self.qss_filename):
+            return self.qss_filename
+        qss_path = str(local_path(__file__, self.qss_filename))
+        return qss_path if os.path.exists(qss_path) else None
+
     def reload_stylesheet(self) -> None:
         """Reload and apply the local stylesheet if qss_filename is set and exists."""
-        if self.qss_filename:
-            # Use absolute path if provided, otherwise resolve relative to this file
-            if os.path.isabs(self.qss_filename) and os.path.exists(self.qss_filename):
-                qss_path = self.qss_filename
-            else:
-                qss_path = str(local_path(__file__, self.qss_filename))
-            if os.path.exists(qss_path):
-                qss = self.theme_manager.load_stylesheet_with_theme(qss_path)
-                if qss:
-                    self.setStyleSheet(qss)
-                else:
-                    self.setStyleSheet("")
-            else:
-                self.setStyleSheet("")
-        else:
-            self.setStyleSheet("")
+        qss = ""
+        if self._qss_path:
+            qss = self.theme_manager.load_stylesheet_with_theme(self._qss_path)
+        self.setStyleSheet(qss)
@@ -1,19 +1,24 @@
+from typing import TYPE_CHECKING
+
+from PyQt6.QtCore import pyqtSlot
 from PyQt6.QtWidgets import QLabel, QPushButton, QVBoxLayout
 
-from app.view_models.base_view_model import BaseViewModel
-from app.view_models.counter_view_model import CounterViewModel
 from app.views.base_view import BaseView
 
+if TYPE_CHECKING:
+    from app.view_models.base_view_model import BaseViewModel
+    from app.view_models.counter_view_model import CounterViewModel
+
 
 class CounterView(BaseView):
     """View for displaying and interacting with the counter."""
 
-    view_model: BaseViewModel
+    view_model: "BaseViewModel"
     layout_: QVBoxLayout
     label: QLabel
     button: QPushButton
 
-    def __init__(self, view_model: CounterViewModel):
+    def __init__(self, view_model: "CounterViewModel"):
         """Initialize the counter view.
 
         Args:
@@ -24,16 +29,20 @@ class CounterView(BaseView):
         # Use self.t for translations and self.theme_manager for theming as needed
         self.init_ui()
 
+        # Connect Signals to Slots
+        self._view_model.count_changed.connect(self.update_label)
+        self._view_model.can_increment_changed.connect(self.update_button)
+
     def init_ui(self) -> None:
         """Initialize the UI components for the counter view."""
-        self.layout_ = QVBoxLayout()
+        self.layout_ = QVBoxLayout(self)
         self.label = QLabel("0")
         self.button = QPushButton("Increment")
         self.button.clicked.connect(self._view_model.increment)
         self.layout_.addWidget(self.label)
         self.layout_.addWidget(self.button)
-        self.setLayout(self.layout_)
 
+    @pyqtSlot(int)
     def update_label(self, count: int) -> None:
         """Update the label to show the current count.
 
@@ -42,6 +51,7 @@ class CounterView(BaseView):
         """
         self.label.setText(str(count))
 
+    @pyqtSlot(bool)
     def update_button(self, is_enabled: bool) -> None:
         """Enable or disable the increment button.
 
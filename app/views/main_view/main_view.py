@@ -1,3 +1,6 @@
+from typing import TYPE_CHECKING
+
+from PyQt6.QtCore import pyqtSlot
 from PyQt6.QtWidgets import (
     QComboBox,
     QHBoxLayout,
@@ -7,14 +10,16 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from app.view_models.main_view_model import MainViewModel
 from app.views.base_view import BaseView
 
+if TYPE_CHECKING:
+    from app.view_models.main_view_model import MainViewModel
+
 
 class MainView(BaseView):
     """Main view for the application UI."""
 
-    _view_model: MainViewModel
+    _view_model: "MainViewModel"
     _main_layout: QVBoxLayout
     _stacked_widget: QStackedWidget
     _button_home: QPushButton
@@ -22,7 +27,7 @@ class MainView(BaseView):
     _language_selector: QComboBox
     _theme_selector: QComboBox
 
-    def __init__(self, view_model: MainViewModel) -> None:
+    def __init__(self, view_model: "MainViewModel") -> None:
         """Initialize the main view.
 
         Args:
@@ -30,7 +35,6 @@ class MainView(BaseView):
         """
         super().__init__(qss_filename="main_view/main_view.qss")
         self._view_model = view_model
-        self.t = self.context.translate
 
         # Connect Signals to Slots
         self._view_model.current_view_changed.connect(self.change_view)
@@ -42,8 +46,7 @@ class MainView(BaseView):
 
     def init_ui(self) -> None:
         """Initialize the UI components for the main view."""
-        self._main_layout = QVBoxLayout()  # Vertical layout
-        self.setLayout(self._main_layout)
+        self._main_layout = QVBoxLayout(self)  # Vertical layout
 
         # Create Widgets
         navbar_layout = self.init_navbar()
@@ -59,15 +62,21 @@ class MainView(BaseView):
         Returns:
             QWidget: The navigation bar widget.
         """
-        navbar_layout = QHBoxLayout()
+        # Encapsulate in QWidget
+        navbar_widget = QWidget()
+        navbar_widget.setFixedHeight(100)
+        navbar_layout = QHBoxLayout(navbar_widget)
 
         # Create Widgets
         self._button_home = QPushButton(self.t(self._view_model.home_label))
         self._button_settings = QPushButton(self.t(self._view_model.settings_label))
 
+        # Selectors are populated and synced before their signals are connected,
+        # so setting the initial selection does not re-apply language or theme
         # Language selector
         self._language_selector = QComboBox()
         self._language_selector.addItems(self._view_model.available_languages)
+        self._select_text(self._language_selector, self._view_model.current_language)
         self._language_selector.currentTextChanged.connect(
             self._view_model.set_language
         )
@@ -75,21 +84,12 @@ class MainView(BaseView):
         # Theme selector
         self._theme_selector = QComboBox()
         self._theme_selector.addItems(self._view_model.available_themes)
+        self._select_text(self._theme_selector, self._view_model.current_theme)
         self._theme_selector.currentTextChanged.connect(self._view_model.set_theme)
-        # Set current theme if available
-        current_theme = self._view_model.current_theme
-        if current_theme:
-            idx = self._theme_selector.findText(current_theme)
-            if idx >= 0:
-                self._theme_selector.setCurrentIndex(idx)
 
         # Bind Commands
-        self._button_home.clicked.connect(
-            lambda: self._view_model.set_current_view("home")
-        )
-        self._button_settings.clicked.connect(
-            lambda: self._view_model.set_current_view("settings")
-        )
+        self._button_home.clicked.connect(self.show_home)
+        self._button_settings.clicked.connect(self.show_settings)
 
         # Add Widgets to Layout
         navbar_layout.addWidget(self._button_home)
@@ -98,13 +98,31 @@ class MainView(BaseView):
         navbar_layout.addWidget(self._language_selector)
         navbar_layout.addWidget(self._theme_selector)
 
-        # Encapsulate in QWidget
-        navbar_widget = QWidget()
-        navbar_widget.setLayout(navbar_layout)
-        navbar_widget.setFixedHeight(100)
-
         return navbar_widget
 
+    @staticmethod
+    def _select_text(combo: QComboBox, text: str) -> None:
+        """Select the item matching the given text, if present.
+
+        Args:
+            combo (QComboBox): The combo box to update.
+            text (str): The item text to select.
+        """
+        if text:
+            idx = combo.findText(text)
+            if idx >= 0:
+                combo.setCurrentIndex(idx)
+
+    @pyqtSlot()
+    def show_home(self) -> None:
+        """Navigate to the home view."""
+        self._view_model.set_current_view("home")
+
+    @pyqtSlot()
+    def show_settings(self) -> None:
+        """Navigate to the settings view."""
+        self._view_model.set_current_view("settings")
+
     def change_view(self, widget: QWidget) -> None:
         """Change the current view in the stacked widget.
 
@@ -113,8 +131,7 @@ class MainView(BaseView):
         """
         index = self._stacked_widget.indexOf(widget)
         if index == -1:
-            self._stacked_widget.addWidget(widget)
-            index = self._stacked_widget.indexOf(widget)
+            index = self._stacked_widget.addWidget(widget)
         self._stacked_widget.setCurrentIndex(index)
 
     def update_translations(self, language_code: str) -> None:
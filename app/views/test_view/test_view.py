@@ -1,13 +1,17 @@
-from app.view_models.base_view_model import BaseViewModel
+from typing import TYPE_CHECKING
+
 from app.views.base_view import BaseView
 
+if TYPE_CHECKING:
+    from app.view_models.base_view_model import BaseViewModel
+
 
 class TestView(BaseView):
     """A simple test view for demonstration purposes."""
 
-    view_model: BaseViewModel
+    view_model: "BaseViewModel"
 
-    def __init__(self, view_model: BaseViewModel):
+    def __init__(self, view_model: "BaseViewModel"):
         """Initialize the test view.
 
         Args:
@@ -29,15 +29,14 @@ if (!(Get-Command make -ErrorAction SilentlyContinue)) {
 # Create virtual environment if not present
 if (!(Test-Path ".venv")) {
     Write-Host "Creating virtual environment..."
-    python -m venv .venv
+    python -m venv --upgrade-deps .venv
 } else {
     Write-Host ".venv already exists."
 }
 
 # Activate virtual environment and install requirements
 Write-Host "Activating virtual environment and installing requirements..."
-.\.venv\Scripts\python.exe -m pip install --upgrade pip
-.\.venv\Scripts\python.exe -m pip install -r requirements.txt
+.\.venv\Scripts\python.exe -m pip install --prefer-binary -r requirements.txt
 
 # Install pre-commit hooks
 Write-Host "Installing pre-commit hooks..."
@@ -0,0 +1,46 @@
+import json
+from pathlib import Path
+
+from app.services.translate_manager import TranslateManager
+
+
+def _write_catalog(locales: Path, language_code: str, data: dict[str, str]) -> Path:
+    """Write a single-file catalog for a language and return its path."""
+    lang_dir = locales / language_code
+    lang_dir.mkdir(parents=True)
+    path = lang_dir / "app.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+def test_load_language_reuses_cached_catalog(tmp_path: Path) -> None:
+    """Switching back to a loaded language is served from the cache."""
+    _write_catalog(tmp_path, "en", {"hello": "Hello"})
+    pl_path = _write_catalog(tmp_path, "pl", {"hello": "Cześć"})
+    manager = TranslateManager(str(tmp_path), default_language="en")
+    en_catalog = manager.translations
+
+    assert manager.load_language("pl")
+    assert manager.t("hello") == "Cześć"
+
+    # Switching back must not re-read the files
+    pl_path.unlink()
+    assert manager.load_language("en")
+    assert manager.translations is en_catalog
+    assert manager.load_language("pl")
+    assert manager.t("hello") == "Cześć"
+
+
+def test_available_languages_sorted_and_scanned_once(tmp_path: Path) -> None:
+    """Languages are listed sorted and the directory is scanned only once."""
+    for code in ("pl", "en", "de"):
+        _write_catalog(tmp_path, code, {"hello": code})
+    (tmp_path / "empty").mkdir()
+    manager = TranslateManager(str(tmp_path), default_language="en")
+
+    assert manager.available_languages() == ["de", "en", "pl"]
+
+    # Later changes on disk are not picked up; callers cannot mutate the list
+    _write_catalog(tmp_path, "fr", {"hello": "Bonjour"})
+    manager.available_languages().append("xx")
+    assert manager.available_languages() == ["de", "en", "pl"]